@@ -1,34 +1,55 @@
 import argparse
 import os
+import sys
 import json
 import logging
-import ast
-import warnings
+from collections import defaultdict, deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
 from typing import Dict, List, Set, Tuple, Optional
 
-# Suppress SyntaxWarnings from ast.parse() on Python 3.12+ (invalid escape sequences in scanned code)
-warnings.filterwarnings("ignore", category=SyntaxWarning)
-
 from .core.models import FileData, RouteDef, RouterDef, IncludeDef
 from .core.resolver import ImportResolver, TypeResolver
-from .core.visitor import ASTVisitor
-from .adapters.fastapi import FastAPIAdapter
-from .adapters.custom import CustomAdapter
-
-# Setup logging
-logging.basicConfig(
-    filename='scanner_debug.log',
-    level=logging.DEBUG,
-    format='%(asctime)s - %(levelname)s - %(message)s'
-)
+from .parser import parse_file, read_file, parse_source, default_cache_dir, prune_cache
+
+# Setup logging: the debug log file is only written when SCANNER_DEBUG is set, otherwise warnings go to stderr
+if os.environ.get("SCANNER_DEBUG"):
+    logging.basicConfig(
+        filename='scanner_debug.log',
+        level=logging.DEBUG,
+        format='%(asctime)s - %(levelname)s - %(message)s'
+    )
+else:
+    logging.basicConfig(level=logging.WARNING, format='%(levelname)s - %(message)s')
+
+# Directory names never descended into (dot-directories are skipped as well)
+EXCLUDED_DIRS = frozenset({'__pycache__', 'node_modules', 'venv', 'env'})
+
+# Below this many files the cost of spawning workers outweighs the parallel parse
+PARALLEL_MIN_FILES = 64
+PARALLEL_CHUNKSIZE = 32
+# Serial parsing prefetches this many files ahead on a few I/O threads
+READ_AHEAD = 64
+READ_THREADS = 4
+
+# Worklist entry kinds for _resolve_router
+ROUTER, CHILD, CHILDREN = 0, 1, 2
+
+def _default_jobs() -> int:
+    """CPUs this process may actually run on (taskset/container limits), not every CPU in the machine."""
+    try:
+        return len(os.sched_getaffinity(0)) or 1
+    except AttributeError:
+        # sched_getaffinity is Linux-only
+        return os.cpu_count() or 1
 
 class ProjectScanner:
-    def __init__(self, path: str):
+    def __init__(self, path: str, jobs: Optional[int] = None, cache_dir: Optional[str] = None, prefilter: bool = True):
         self.root = Path(path).resolve()
         self.files: Dict[str, FileData] = {}
         self.endpoints: List[RouteDef] = []
-        self.parent_child: Dict[str, List[str]] = {} 
+        self.parent_child: Dict[str, List[str]] = defaultdict(list)
         self.global_includes_children: Set[str] = set()
         self.errors: List[Dict[str, str]] = []
         
@@ -36,44 +57,33 @@ class ProjectScanner:
         # Type resolver initialized after file scan or lazily
         self.type_resolver = None
         self.canonical_map = {}  # maps "file:alias_key" -> "file:canonical_key"
+        self.router_ids: Dict[Tuple[str, str], str] = {}  # (file, var) -> canonical "file:var", filled after scan
+        self.jobs = jobs if jobs is not None else _default_jobs()
+        self.cache_dir = cache_dir  # None disables the on-disk parse cache
+        self.prefilter = prefilter  # light visit for files with no API markers (see parser.MARKERS)
 
     def scan(self, deps_only: bool = False):
-        # 1. Parse all files
-        for r, ds, fs in os.walk(self.root):
-            if any(p.startswith('.') or p in ['__pycache__', 'node_modules', 'venv', 'env'] for p in Path(r).parts): continue
-            for f in fs:
-                if f.endswith('.py'):
-                    full_path = Path(r) / f
-                    rel_path = str(full_path.relative_to(self.root)).replace('\\', '/')
-                    try:
-                        with open(full_path, 'r', encoding='utf-8') as fobj:
-                            source = fobj.read()
-                            tree = ast.parse(source, filename=str(full_path))
-                            fd = FileData(rel_path)
-                            
-                            if deps_only:
-                                # Lightweight scan
-                                from .core.visitor import ImportVisitor
-                                visitor = ImportVisitor(fd)
-                                visitor.visit(tree)
-                            else:
-                                # Full scan
-                                adapters = [
-                                    CustomAdapter(fd.constants),
-                                    FastAPIAdapter(fd.constants)
-                                ]
-                                visitor = ASTVisitor(fd, adapters)
-                                visitor.visit(tree)
-                                
-                                for c in visitor.include_child_calls:
-                                    resolved = self._resolve_local_var(fd, c)
-                                    self.global_includes_children.add(resolved)
-                            
-                            self.files[rel_path] = fd
-                                
-                    except Exception as e:
-                        self.errors.append({"file": rel_path, "error": str(e)})
-                        logging.error(f"Failed to parse {rel_path}: {e}")
+        # 1. Collect all files, then parse them (in parallel for larger projects)
+        root_prefix = os.path.join(str(self.root), '')
+        tasks = []
+        for full_path in self._walk(str(self.root)):
+            rel_path = full_path[len(root_prefix):].replace('\\', '/')
+            tasks.append((full_path, rel_path, deps_only, self.cache_dir, self.prefilter))
+
+        include_child_calls = []
+        for rel_path, fd, calls, error in self._parse_all(tasks):
+            if error is not None:
+                self.errors.append({"file": rel_path, "error": error})
+                logging.error("Failed to parse %s: %s", rel_path, error)
+                continue
+            self.files[rel_path] = fd
+            if calls:
+                include_child_calls.append((fd, calls))
+
+        # Resolved only once every file is known, so cross-file lookups don't depend on walk order
+        for fd, calls in include_child_calls:
+            for c in calls:
+                self.global_includes_children.add(self._resolve_local_var(fd, c))
 
         self.type_resolver = TypeResolver(self.import_resolver, self.files)
 
@@ -97,7 +107,13 @@ class ProjectScanner:
                 if full_key != canonical_key:
                     self.canonical_map[full_key] = canonical_key
 
-        # 2b. Build Hierarchy
+        # Precompute canonical ids once so resolution doesn't rebuild "file:var" strings per visit
+        for fd in self.files.values():
+            for var_name in fd.routers:
+                self.router_ids[(fd.file_path, var_name)] = self._router_id(fd.file_path, var_name)
+
+        # 2b. Build Hierarchy (children keep their discovery order; the set only dedupes edges)
+        edges = set()
         for fd in self.files.values():
             seen_router_ids = set()
             for r in fd.routers.values():
@@ -107,14 +123,71 @@ class ProjectScanner:
                 if r.parent_var:
                     parent_id = self._resolve_local_var(fd, r.parent_var)
                     parent_id = self.canonical_map.get(parent_id, parent_id)
-                    child_id = f"{fd.file_path}:{r.var_name}"
-                    child_id = self.canonical_map.get(child_id, child_id)
+                    child_id = self._router_id(fd.file_path, r.var_name)
 
-                    if parent_id not in self.parent_child:
-                        self.parent_child[parent_id] = []
-                    if child_id not in self.parent_child[parent_id]:
+                    if (parent_id, child_id) not in edges:
+                        edges.add((parent_id, child_id))
                         self.parent_child[parent_id].append(child_id)
 
+        # 3. Drop cache entries for files no scan has used in a while
+        if self.cache_dir:
+            prune_cache(self.cache_dir)
+
+    def _walk(self, directory: str):
+        """
+        Yield .py file paths in os.walk order (a directory's files before its subdirectories),
+        pruning excluded directories before descending so their subtrees are never listed.
+        """
+        subdirs = []
+        try:
+            it = os.scandir(directory)
+        except OSError:
+            return
+        with it:
+            for entry in it:
+                if entry.is_dir():
+                    # Like os.walk, symlinked directories are not followed
+                    if not entry.is_symlink() and not entry.name.startswith('.') and entry.name not in EXCLUDED_DIRS:
+                        subdirs.append(entry.path)
+                elif entry.name.endswith('.py'):
+                    yield entry.path
+        for d in subdirs:
+            yield from self._walk(d)
+
+    def _parse_all(self, tasks):
+        if self.jobs <= 1 or len(tasks) < PARALLEL_MIN_FILES:
+            return self._parse_serial(tasks)
+        # No point starting more workers than there are chunks to hand out
+        workers = min(self.jobs, -(-len(tasks) // PARALLEL_CHUNKSIZE))
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as ex:
+                return list(ex.map(parse_file, tasks, chunksize=PARALLEL_CHUNKSIZE))
+        except (OSError, BrokenProcessPool) as e:
+            # Some sandboxes forbid spawning processes; parse serially instead
+            logging.warning("Parallel parse unavailable, falling back to serial: %s", e)
+            return self._parse_serial(tasks)
+
+    def _parse_serial(self, tasks):
+        """Parse on this thread while I/O threads read (or load from cache) up to READ_AHEAD files ahead."""
+        if len(tasks) <= 1:
+            return [parse_file(t) for t in tasks]
+        results = []
+        pending = deque()
+        remaining = iter(tasks)
+        with ThreadPoolExecutor(max_workers=READ_THREADS) as ex:
+            for t in remaining:
+                pending.append((t, ex.submit(read_file, t)))
+                if len(pending) >= READ_AHEAD:
+                    break
+            while pending:
+                t, fut = pending.popleft()
+                nxt = next(remaining, None)
+                if nxt is not None:
+                    pending.append((nxt, ex.submit(read_file, nxt)))
+                result, source, stamp = fut.result()
+                results.append(result if result is not None else parse_source(t, source, stamp))
+        return results
+
     def _expand_factory_routers(self):
         """Expand single factory-created routers into multiple routers using cross-file dict data."""
         import re
@@ -245,39 +318,62 @@ class ProjectScanner:
                         self.endpoints.append(route)
         else:
             for fd, r in apps:
-                self._resolve_router(fd, r, "", set(), level=0)
-
-    def _resolve_router(self, fd: FileData, r: RouterDef, prefix: str, visited: Set[str], level: int):
-        router_id = f"{fd.file_path}:{r.var_name}"
-        router_id = self.canonical_map.get(router_id, router_id)
-        if router_id in visited: return
-        visited.add(router_id)
-
-        current_prefix = (prefix.rstrip('/') + '/' + r.prefix.lstrip('/')).rstrip('/')
-        
-        for route in r.routes:
-            full = (current_prefix.rstrip('/') + '/' + route.path.lstrip('/')).rstrip('/')
-            route.full_path = full or "/"
-            self._finalize_route(route)
-            self.endpoints.append(route)
-
-        for inc in r.includes:
-             target_fd, target_router_def = self._resolve_router_ref(fd, inc.router_var)
-             if target_fd and target_router_def:
-                 new_prefix = (current_prefix.rstrip('/') + '/' + inc.prefix.lstrip('/')).rstrip('/')
-                 self._resolve_router(target_fd, target_router_def, new_prefix, visited, level)
-
+                self._resolve_router(fd, r, (), set(), level=0)
+
+    def _resolve_router(self, fd: FileData, r: RouterDef, prefix: Tuple[str, ...], visited: Set[str], level: int):
+        # Walked with an explicit stack so deep include chains can't hit the recursion limit.
+        # Entries are popped in the same pre-order the recursive walk used: a router's routes, then each
+        # include's whole subtree, then its magic children (queued as a CHILDREN entry so the check
+        # still runs after the includes).
+        stack = [(ROUTER, fd, r, prefix, level)]
+        while stack:
+            kind, fd, r, prefix, level = stack.pop()
+            if kind == CHILDREN:
+                self._push_children(stack, fd, r, prefix, level)
+                continue
+            if kind == CHILD:
+                # Propagate includes_children recursively (include_child_router is recursive at runtime)
+                r.includes_children = True
+
+            router_id = self._router_id(fd.file_path, r.var_name)
+            if router_id in visited: continue
+            visited.add(router_id)
+
+            # Prefixes travel as tuples of slash-stripped pieces and are joined once per route
+            current_prefix = self._extend(prefix, r.prefix)
+
+            base = "".join("/" + part for part in current_prefix)
+            for route in r.routes:
+                path = route.path.strip('/')
+                route.full_path = base + "/" + path if path else (base or "/")
+                self._finalize_route(route)
+                self.endpoints.append(route)
+
+            stack.append((CHILDREN, fd, r, current_prefix, level))
+            for inc in reversed(r.includes):
+                 target_fd, target_router_def = self._resolve_router_ref(fd, inc.router_var)
+                 if target_fd and target_router_def:
+                     new_prefix = self._extend(current_prefix, inc.prefix)
+                     stack.append((ROUTER, target_fd, target_router_def, new_prefix, level))
+
+    def _push_children(self, stack: list, fd: FileData, r: RouterDef, current_prefix: Tuple[str, ...], level: int):
+        router_id = self._router_id(fd.file_path, r.var_name)
         is_magic = r.includes_children or (router_id in self.global_includes_children)
-        if is_magic and router_id in self.parent_child:
-            for child_id in self.parent_child[router_id]:
-                c_file, c_var = child_id.split(':')
-                if c_file in self.files and c_var in self.files[c_file].routers:
-                     child_router = self.files[c_file].routers[c_var]
-                     # Propagate includes_children recursively (include_child_router is recursive at runtime)
-                     child_router.includes_children = True
-                     child_prefix = f"/{{p{level+1}_pk}}"
-                     new_prefix = (current_prefix.rstrip('/') + child_prefix).rstrip('/')
-                     self._resolve_router(self.files[c_file], child_router, new_prefix, visited, level + 1)
+        if not (is_magic and router_id in self.parent_child): return
+
+        new_prefix = current_prefix + (f"{{p{level+1}_pk}}",)
+        entries = []
+        for child_id in self.parent_child[router_id]:
+            c_file, c_var = child_id.split(':')
+            if c_file in self.files and c_var in self.files[c_file].routers:
+                 entries.append((CHILD, self.files[c_file], self.files[c_file].routers[c_var], new_prefix, level + 1))
+        stack.extend(reversed(entries))
+
+    @staticmethod
+    def _extend(parts: Tuple[str, ...], piece: str) -> Tuple[str, ...]:
+        """Append a URL path piece without its outer slashes; empty pieces add nothing."""
+        piece = piece.strip('/')
+        return parts + (piece,) if piece else parts
 
     def _resolve_router_ref(self, fd: FileData, router_var: str) -> Tuple[Optional[FileData], Optional[RouterDef]]:
         if router_var in fd.routers:
@@ -293,28 +389,30 @@ class ProjectScanner:
                     return target_fd, target_fd.routers[target_name]
         return None, None
 
+    def _router_id(self, file_path: str, var_name: str) -> str:
+        """Canonical "file:var" id, served from router_ids once scan() has filled it."""
+        rid = self.router_ids.get((file_path, var_name))
+        if rid is None:
+            rid = f"{file_path}:{var_name}"
+            rid = self.canonical_map.get(rid, rid)
+        return rid
+
     def _resolve_local_var(self, fd: FileData, var_name: str) -> str:
         if var_name in fd.routers:
-            result = f"{fd.file_path}:{var_name}"
-            return self.canonical_map.get(result, result)
+            return self._router_id(fd.file_path, var_name)
 
         if var_name in fd.imports:
             imp = fd.imports[var_name]
             fpath, member = self.import_resolver.resolve_module(imp, fd.file_path)
             if fpath:
                 target_name = member if member else imp.split('.')[-1]
-                result = f"{fpath}:{target_name}"
-                return self.canonical_map.get(result, result)
-        result = f"{fd.file_path}:{var_name}"
-        return self.canonical_map.get(result, result)
+                return self._router_id(fpath, target_name)
+        return self._router_id(fd.file_path, var_name)
         
     def _finalize_route(self, route: RouteDef):
-        route.dependencies["grouped"] = (
-            route.dependencies["services"] + 
-            route.dependencies["database"] + 
-            route.dependencies["external"] + 
-            route.dependencies["utilities"]
-        )
+        deps = route.dependencies
+        if deps is not None:
+            deps["grouped"] = deps["services"] + deps["database"] + deps["external"] + deps["utilities"]
         
         fd = self.files[route.file_path]
         rdef = None
@@ -340,18 +438,49 @@ def main():
     p = argparse.ArgumentParser()
     p.add_argument("path")
     p.add_argument("--deps", action="store_true", help="Output dependency graph instead of endpoints")
+    p.add_argument("--jobs", type=int, default=None, help="Worker processes for parsing (default: usable CPU count, 1 disables)")
+    p.add_argument("--cache-dir", default=None, help="Directory for cached parse results (default: user cache dir)")
+    p.add_argument("--no-cache", action="store_true", help="Always re-parse every file")
+    p.add_argument("--pretty", action="store_true", help="Indent the JSON output")
+    p.add_argument("--no-prefilter", action="store_true", help="Run the full visitor on every file, even those with no API markers")
     args = p.parse_args()
     
-    scanner = ProjectScanner(args.path)
+    cache_dir = None if args.no_cache else (args.cache_dir or default_cache_dir())
+    scanner = ProjectScanner(args.path, jobs=args.jobs, cache_dir=cache_dir, prefilter=not args.no_prefilter)
     scanner.scan(deps_only=args.deps)
     
     if args.deps:
         graph = generate_dependency_graph(scanner.files, scanner.import_resolver, scanner.errors)
-        print(json.dumps(graph, indent=2))
+        write_json(graph, args.pretty)
         return
 
     scanner.resolve()
-    print(json.dumps([r.to_dict() for r in scanner.endpoints], indent=2))
+    # RouteDefs are converted by _json_default as they're written, so only one route's dict exists at a time
+    write_json(scanner.endpoints, args.pretty)
+
+def _json_default(obj):
+    if isinstance(obj, RouteDef):
+        return obj.to_dict()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+def write_json(obj, pretty: bool = False):
+    """Stream obj to stdout piece by piece instead of building the whole document as one string."""
+    write = sys.stdout.write
+    if pretty:
+        # indent always goes through the pure-Python encoder, so iterencode costs nothing extra here
+        for chunk in json.JSONEncoder(indent=2, default=_json_default).iterencode(obj):
+            write(chunk)
+    elif isinstance(obj, list):
+        # iterencode would drop to the pure-Python encoder; encoding per element keeps the C one
+        encode = json.JSONEncoder(separators=(',', ':'), default=_json_default).encode
+        write('[')
+        for i, item in enumerate(obj):
+            if i: write(',')
+            write(encode(item))
+        write(']')
+    else:
+        write(json.dumps(obj, separators=(',', ':')))
+    write('\n')
 
 if __name__ == "__main__":
     main()
@@ -6,6 +6,10 @@ class BaseAdapter(ABC):
     def __init__(self, constants: Dict[str, str]):
         self.constants = constants
 
+    def set_constants(self, constants: Dict[str, str]):
+        """Point a reused adapter at the constants of the file about to be visited."""
+        self.constants = constants
+
     @abstractmethod
     def parse_decorator(self, decorator: ast.Call, func_node: ast.FunctionDef) -> Optional[Tuple[str, str, Optional[str]]]:
         """
@@ -24,9 +28,13 @@ class BaseAdapter(ABC):
         return False
 
     def _get_func_name(self, node):
-        if isinstance(node, ast.Name): return node.id
-        if isinstance(node, ast.Attribute): return f"{self._get_func_name(node.value)}.{node.attr}"
-        return ""
+        # Walk the attribute chain once and join, rather than formatting a new string per level
+        parts = []
+        while isinstance(node, ast.Attribute):
+            parts.append(node.attr)
+            node = node.value
+        parts.append(node.id if isinstance(node, ast.Name) else "")
+        return ".".join(reversed(parts))
 
     def _extract_kwarg(self, node, name, default):
         for k in node.keywords:
@@ -34,16 +42,14 @@ class BaseAdapter(ABC):
         return default
 
     def _extract_str(self, node):
-        if isinstance(node, (ast.Constant, ast.Str)): return str(node.value)
+        if isinstance(node, ast.Constant): return str(node.value)
         if isinstance(node, ast.Name): return self.constants.get(node.id, node.id)
         if isinstance(node, ast.JoinedStr):
-            res = ""
+            constants = self.constants
+            parts = []
             for v in node.values:
-                if isinstance(v, (ast.Constant, ast.Str)): res += str(v.value)
+                if isinstance(v, ast.Constant): parts.append(str(v.value))
                 elif isinstance(v, ast.FormattedValue):
-                     if isinstance(v.value, ast.Name):
-                         res += self.constants.get(v.value.id, "{}")
-                     else:
-                         res += "{}"
-            return res
+                     parts.append(constants.get(v.value.id, "{}") if isinstance(v.value, ast.Name) else "{}")
+            return "".join(parts)
         return ""
@@ -2,11 +2,25 @@ import ast
 from typing import Optional, Tuple
 from .base import BaseAdapter
 
+# register_* decorators, matched by substring in this order (register_create_schema -> POST "/")
+REGISTER_ROUTES = (
+    ('create', 'POST', "/"),
+    ('update', 'PUT', "/{pk}"),
+    ('delete', 'DELETE', "/{pk}"),
+    ('list', 'GET', "/"),
+    ('retrieve', 'GET', "/{pk}"),
+)
+# Custom action decorator -> (method, path template filled with the function name)
+ACTION_ROUTES = {
+    'list_action': ('GET', "/{}"),
+    'get_action': ('GET', "/{{pk}}/{}"),
+    'post_action': ('POST', "/{}"),
+    'put_action': ('PUT', "/{{pk}}/{}"),
+}
+
 class CustomAdapter(BaseAdapter):
     def parse_decorator(self, decorator: ast.Call, func_node: ast.FunctionDef) -> Optional[Tuple[str, str, Optional[str]]]:
-        fname = self._get_func_name(decorator.func)
-        parts = fname.split('.')
-        method_name = parts[-1]
+        method_name = self._get_func_name(decorator.func).rpartition('.')[2]
         
         # 1. Register Action pattern (register_create_schema, etc) -> These define routes implicitly in usage, BUT usually these are just schema setup.
         # However, the previous code treated 'register_' as route triggers if it had specific naming like list, retrieve.
@@ -16,25 +30,16 @@ class CustomAdapter(BaseAdapter):
         # So yes, if used as `@router.register_list_schema(Schema)`, the decorated function BECOMES the endpoint.
         
         if method_name.startswith('register_'):
-            method, path = None, None
-            resp_arg = None
-            if 'create' in method_name: method, path = 'POST', "/"
-            elif 'update' in method_name: method, path = 'PUT', "/{pk}"
-            elif 'delete' in method_name: method, path = 'DELETE', "/{pk}"
-            elif 'list' in method_name: method, path = 'GET', "/"
-            elif 'retrieve' in method_name: method, path = 'GET', "/{pk}"
-            
-            if method:
-                # Arg handling varies
-                return method, path, None
+            for keyword, method, path in REGISTER_ROUTES:
+                if keyword in method_name:
+                    # Arg handling varies
+                    return method, path, None
 
         # 2. Custom Actions (list_action, get_action, etc)
-        if method_name in ['list_action', 'get_action', 'post_action', 'put_action']:
-            if 'list' in method_name: method, path = 'GET', f"/{func_node.name}"
-            elif 'get' in method_name: method, path = 'GET', f"/{{pk}}/{func_node.name}"
-            elif 'post' in method_name: method, path = 'POST', f"/{func_node.name}"
-            elif 'put' in method_name: method, path = 'PUT', f"/{{pk}}/{func_node.name}"
-            return method, path, "read_schema"
+        action = ACTION_ROUTES.get(method_name)
+        if action is not None:
+            method, path = action
+            return method, path.format(func_node.name), "read_schema"
 
         # 3. Generic Action
         if 'action' in method_name:
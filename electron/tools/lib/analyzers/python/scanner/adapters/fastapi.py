@@ -2,13 +2,13 @@ import ast
 from typing import Optional, Tuple
 from .base import BaseAdapter
 
+HTTP_METHODS = frozenset({'get', 'post', 'put', 'delete', 'patch', 'options', 'head'})
+
 class FastAPIAdapter(BaseAdapter):
     def parse_decorator(self, decorator: ast.Call, func_node: ast.FunctionDef) -> Optional[Tuple[str, str, Optional[str]]]:
-        fname = self._get_func_name(decorator.func)
-        parts = fname.split('.')
-        method_name = parts[-1]
+        method_name = self._get_func_name(decorator.func).rpartition('.')[2]
         
-        if method_name in ['get', 'post', 'put', 'delete', 'patch', 'options', 'head']:
+        if method_name in HTTP_METHODS:
             method = method_name.upper()
             if decorator.args:
                 path = self._extract_str(decorator.args[0])
@@ -1,33 +1,74 @@
+import sys
 from typing import List, Dict, Optional, Any, Set
 
 class SchemaField:
+    __slots__ = ('name', 'type_name', 'required', '_dict')
     def __init__(self, name: str, type_name: str, required: bool):
-        self.name = name; self.type_name = type_name; self.required = required
-    def to_dict(self): return {"name": self.name, "type": self.type_name, "required": self.required}
+        # Field names and types ("id", "int", "Optional[str]") repeat across every model; share one copy
+        self.name = sys.intern(name); self.type_name = sys.intern(type_name); self.required = required
+        self._dict = None
+    def to_dict(self):
+        # The same field objects back every route using the model, so build the dict once and share it
+        if self._dict is None: self._dict = {"name": self.name, "type": self.type_name, "required": self.required}
+        return self._dict
+
+# Dependency categories, in output order. "grouped" is filled in once the route is resolved.
+DEP_CATEGORIES = ("services", "database", "external", "utilities", "tables", "apiCalls")
+# Categories holding DepEntry objects; tables and apiCalls are plain strings
+ENTRY_CATEGORIES = frozenset({"services", "database", "external", "utilities", "grouped"})
+
+class DepEntry:
+    __slots__ = ('module', 'type', 'items')
+    def __init__(self, module: str, type_: str):
+        self.module = module; self.type = type_; self.items: List[str] = []
+    def to_dict(self):
+        # moduleLabel mirrors module and count has always been 1; both stay for the UI
+        return {"module": self.module, "moduleLabel": self.module, "type": self.type, "items": self.items, "count": 1}
 
 class RouteDef:
+    __slots__ = ('path', 'method', 'router_var', 'lineno', 'file_path', 'full_path', 'function_name', 'dependencies',
+                 'request_schema', 'response_schema', 'request_model_name', 'response_model_name')
+
     def __init__(self, path: str, method: str, router_var: str, lineno: int, file_path: str, function_name: str = None):
-        self.path = path; self.method = method; self.router_var = router_var
+        # method and router_var take a handful of values per project but arrive as fresh strings (upper(), split())
+        self.path = path; self.method = sys.intern(method); self.router_var = sys.intern(router_var)
         self.lineno = lineno; self.file_path = file_path; self.full_path = ""
         self.function_name = function_name
-        self.dependencies = {"services": [], "database": [], "external": [], "utilities": [], "tables": [], "apiCalls": []}
+        # Most routes record no dependencies, so the category lists are only built on first use (see deps())
+        self.dependencies: Optional[Dict[str, list]] = None
         self.request_schema: List[SchemaField] = []; self.response_schema: List[SchemaField] = []
         self.request_model_name: Optional[str] = None; self.response_model_name: Optional[str] = None
 
+    def deps(self) -> Dict[str, list]:
+        if self.dependencies is None:
+            self.dependencies = {cat: [] for cat in DEP_CATEGORIES}
+        return self.dependencies
+
     def to_dict(self):
+        deps = self.dependencies
+        if deps is None:
+            deps = {cat: [] for cat in DEP_CATEGORIES}
+            deps["grouped"] = []
+        else:
+            deps = {cat: [e.to_dict() for e in entries] if cat in ENTRY_CATEGORIES else entries
+                    for cat, entries in deps.items()}
         return {
             "path": self.path, "method": self.method, "router_var": self.router_var,
             "lineno": self.lineno, "file_path": self.file_path, "full_path": self.full_path or self.path,
             "function_name": self.function_name,
-            "dependencies": self.dependencies,
+            "dependencies": deps,
             "request_schema": [f.to_dict() for f in self.request_schema],
             "response_schema": [f.to_dict() for f in self.response_schema]
         }
 
 class IncludeDef:
+    __slots__ = ('router_var', 'prefix')
     def __init__(self, router_var: str, prefix: str = ""): self.router_var = router_var; self.prefix = prefix
 
 class RouterDef:
+    __slots__ = ('var_name', 'prefix', 'model_name', 'parent_var', 'includes_children', 'includes', 'routes',
+                 'list_schema', 'retrieve_schema', 'create_schema', 'update_schema', 'delete_schema')
+
     def __init__(self, var_name: str, prefix: str = "", model_name: str = None, parent_var: str = None):
         self.var_name = var_name; self.prefix = prefix; self.model_name = model_name
         self.parent_var = parent_var; self.includes_children = False
@@ -35,8 +76,11 @@ class RouterDef:
         self.list_schema = self.retrieve_schema = self.create_schema = self.update_schema = self.delete_schema = None
 
 class FileData:
+    __slots__ = ('file_path', 'imports', 'routers', 'app_var', 'models', 'constants',
+                 'list_literals', 'dict_literals', 'dict_router_keys', 'dict_includes')
+
     def __init__(self, file_path: str):
-        self.file_path = file_path
+        self.file_path = sys.intern(file_path)  # used as a dict key throughout resolution
         self.imports: Dict[str, str] = {} # alias -> full_import_path
         self.routers: Dict[str, RouterDef] = {}
         self.app_var: Optional[str] = None
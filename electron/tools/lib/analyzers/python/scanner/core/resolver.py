@@ -7,6 +7,11 @@ class ImportResolver:
     def __init__(self, project_root: Path, file_map: Dict[str, FileData]):
         self.root = project_root
         self.files = file_map
+        # module_str -> (file_path, member_name). Resolution only depends on the module string and
+        # the set of scanned files, so results are shared across every importing file.
+        self._cache: Dict[str, Tuple[Optional[str], Optional[str]]] = {}
+        self._modules: Dict[str, str] = {}  # dotted module name -> rel_path
+        self._cache_files = -1
 
     def resolve_module(self, module_str: str, current_file: str) -> Tuple[Optional[str], Optional[str]]:
         """
@@ -15,34 +20,54 @@ class ImportResolver:
                  "app.models.user.User" -> ("app/models/user.py", "User")
         """
         if not module_str: return None, None
-        
-        parts = module_str.split('.')
-        # Try to match largest prefix to a file
-        for i in range(len(parts), 0, -1):
-            path_parts = parts[:i]
-            member_parts = parts[i:]
-            
-            # Construct potential file paths
-            # 1. As regular file
-            rel_path = "/".join(path_parts) + ".py"
-            # 2. As package init
-            init_path = "/".join(path_parts) + "/__init__.py"
 
-            if rel_path in self.files:
-                return rel_path, (member_parts[0] if member_parts else None)
-            if init_path in self.files:
-                return init_path, (member_parts[0] if member_parts else None)
-        
+        # The file map is shared with the scanner; rebuild the index if it has grown since
+        if len(self.files) != self._cache_files:
+            self._build_index()
+        cached = self._cache.get(module_str)
+        if cached is None:
+            cached = self._cache[module_str] = self._resolve_uncached(module_str)
+        return cached
+
+    def _build_index(self):
+        self._cache.clear()
+        self._modules = modules = {}
+        for rel_path in self.files:
+            if not rel_path.endswith('.py'): continue
+            mod = rel_path[:-len('.py')]
+            # Dotted directory/file names can't be imported, so they never match
+            if not mod or '.' in mod: continue
+            modules[mod.replace('/', '.')] = rel_path
+            if mod.endswith('/__init__'):
+                # A plain module file wins over a package of the same name
+                modules.setdefault(mod[:-len('/__init__')].replace('/', '.'), rel_path)
+        self._cache_files = len(self.files)
+
+    def _resolve_uncached(self, module_str: str) -> Tuple[Optional[str], Optional[str]]:
+        # Try to match largest prefix to a file, e.g. "a.b.C" -> "a.b", then "a" (member "b")
+        mod, member = module_str, None
+        while mod:
+            rel_path = self._modules.get(mod)
+            if rel_path is not None:
+                return rel_path, member
+            mod, _, member = mod.rpartition('.')
         return None, None
 
 class TypeResolver:
     def __init__(self, import_resolver: ImportResolver, file_map: Dict[str, FileData]):
         self.resolver = import_resolver
         self.files = file_map
+        # (file_path, model_name) -> fields, for top-level lookups only: nested calls carry a visited
+        # set, and a model cut short by a cycle there can resolve to fewer fields than it does alone
+        self._cache: Dict[Tuple[str, str], List[SchemaField]] = {}
 
     def find_model_fields(self, file_data: FileData, model_name: str, visited: Set[Tuple[str, str]] = None) -> List[SchemaField]:
-        if visited is None: visited = set()
         model_id = (file_data.file_path, model_name)
+        if visited is None:
+            fields = self._cache.get(model_id)
+            if fields is None:
+                fields = self._cache[model_id] = self.find_model_fields(file_data, model_name, set())
+            return fields
         if model_id in visited: return []
         visited.add(model_id)
 
@@ -51,11 +76,12 @@ class TypeResolver:
             model_def = file_data.models[model_name]
             fields = {f.name: f for f in model_def['fields']}
             
-            # Inherited fields
+            # Inherited fields. visited is shared across bases: a model already reached through an
+            # earlier base contributed all of its names then, so seeing it again could add nothing.
             for base in model_def.get('bases', []):
                 # We care about Pydantic/SQLModel bases
-                if any(x in base for x in ["BaseModel", "SQLModel", "Schema", "Model"]):
-                    base_fields = self.find_model_fields(file_data, base, visited.copy())
+                if "Model" in base or "Schema" in base:  # also covers BaseModel / SQLModel
+                    base_fields = self.find_model_fields(file_data, base, visited)
                     for bf in base_fields:
                         if bf.name not in fields: fields[bf.name] = bf
             return list(fields.values())
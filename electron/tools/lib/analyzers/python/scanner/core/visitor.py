@@ -1,10 +1,59 @@
 import ast
+import re
+import sys
+from collections import deque
 from typing import Set, List, Optional
-from .models import FileData, SchemaField, RouteDef, RouterDef, IncludeDef
+from .models import FileData, SchemaField, RouteDef, RouterDef, IncludeDef, DepEntry
 from ..adapters.base import BaseAdapter
 import os
 
-
+# visitor class -> {node type -> unbound handler}, filled lazily by ImportVisitor.visit
+_HANDLERS = {}
+# node type -> fields worth descending into ('ctx' only ever holds Load/Store/Del)
+_CHILD_FIELDS = {}
+# Node types that can hold import statements: statements themselves plus the
+# except/case clauses whose bodies are statement lists (match_case is 3.10+)
+_STMT_TYPES = (ast.stmt, ast.excepthandler) + ((ast.match_case,) if hasattr(ast, 'match_case') else ())
+# Generic wrappers whose first type argument is the model that matters (List[User] -> User)
+_TYPE_WRAPPERS = frozenset({'Annotated', 'List', 'Optional', 'Union', 'ApiResponse', 'Type', 'Generic'})
+# Parameter annotations that are framework plumbing rather than the route's request body
+_SPECIAL_TYPES = frozenset({'Request', 'Response', 'BackgroundTasks', 'Session', 'AsyncSession', 'HTTPConnection', 'WebSocket', 'HTTPException'})
+# Containers searched for an Annotated[..., Depends()] inside (Optional[Annotated[...]])
+_DEPENDENCY_CONTAINERS = frozenset({'Optional', 'List', 'Union', 'Iterable', 'Sequence'})
+# NodeVisitor's own visit_Constant only forwards to the legacy visit_Num/visit_Str hooks; it is
+# gone in Python 3.14, so look it up once rather than touching the attribute per node type
+_NODEVISITOR_CONSTANT = getattr(ast.NodeVisitor, 'visit_Constant', None)
+# Subscript slices are wrapped in ast.Index before Python 3.9. Later versions keep ast.Index only
+# as a deprecated stub that never appears in a tree, so it isn't touched there at all.
+_INDEX = ast.Index if sys.version_info < (3, 9) else ()
+# Dependency classification, run on every call inside a route handler
+_DB_DEP_NAME = re.compile(r'db|session|repo|database').search  # applied to the lowercased name
+_DB_ROOT = re.compile(r'session|db|repo').search
+_DB_VERB = re.compile(r'exec|add|commit|query|get|flush|refresh').search
+_SQL_FUNCS = frozenset({"select", "update", "delete", "insert"})
+_HTTP_CLIENTS = ("requests.", "httpx.")
+# CrudAPIRouter schema registration call -> RouterDef attribute it sets
+_SCHEMA_REGISTRATIONS = {
+    'register_list_schema': 'list_schema',
+    'register_retrieve_schema': 'retrieve_schema',
+    'register_create_schema': 'create_schema',
+    'register_update_schema': 'update_schema',
+    'register_delete_schema': 'delete_schema',
+}
+
+def _walk_statements(node):
+    """
+    ast.walk restricted to statements (and the except/case clauses holding them): yields the
+    same statements in the same breadth-first order without descending into any expression.
+    """
+    todo = deque([node])
+    while todo:
+        node = todo.popleft()
+        for field in node._fields:
+            value = getattr(node, field, None)
+            if value.__class__ is list:
+                todo.extend(item for item in value if isinstance(item, _STMT_TYPES))
+        yield node
 
 class ImportVisitor(ast.NodeVisitor):
     """
@@ -13,23 +62,115 @@ class ImportVisitor(ast.NodeVisitor):
     """
     def __init__(self, file_data: FileData):
         self.data = file_data
+        self._handlers = _HANDLERS.setdefault(type(self), {})
+
+    def visit(self, node):
+        # Same dispatch as ast.NodeVisitor.visit, with the handler looked up once per node type
+        cls = node.__class__
+        handler = self._handlers.get(cls)
+        if handler is None:
+            handler = self._lookup_handler(cls)
+        return handler(self, node)
+
+    def _lookup_handler(self, cls):
+        handler = getattr(type(self), 'visit_' + cls.__name__, None)
+        if handler is None or handler is _NODEVISITOR_CONSTANT:
+            handler = type(self).generic_visit
+        self._handlers[cls] = handler
+        return handler
+
+    def generic_visit(self, node):
+        # Imports are statements, so only statement lists need walking; expressions are skipped whole
+        visit = self.visit
+        for field in node._fields:
+            value = getattr(node, field, None)
+            if value.__class__ is list:
+                for item in value:
+                    if isinstance(item, _STMT_TYPES): visit(item)
+
+    # Import nodes only hold aliases, so neither handler needs to descend any further
 
     def visit_Import(self, node):
-        for alias in node.names:
-            self.data.imports[alias.asname or alias.name] = alias.name
-        self.generic_visit(node)
+        self.data.imports.update((alias.asname or alias.name, alias.name) for alias in node.names)
 
     def visit_ImportFrom(self, node):
-        module = node.module or ""
-        level = node.level or 0
-        prefix = "." * level
-        source = f"{prefix}{module}" if module else prefix
-        for alias in node.names:
-            full_name = f"{source}.{alias.name}" if source else alias.name
-            self.data.imports[alias.asname or alias.name] = full_name
-        self.generic_visit(node)
+        source = "." * (node.level or 0) + (node.module or "")
+        source_dot = source + "." if source else ""
+        self.data.imports.update((alias.asname or alias.name, source_dot + alias.name) for alias in node.names)
+
+class LiteralParsingMixin:
+    """Dotted-name and dict-literal helpers shared by ASTVisitor and LiteralVisitor."""
+
+    def _get_func_name(self, node):
+        # Iterative walk of the attribute chain; calls along the way are looked through ("a().b" -> "a.b")
+        parts = []
+        while True:
+            if isinstance(node, ast.Attribute):
+                parts.append(node.attr)
+                node = node.value
+            elif isinstance(node, ast.Call):
+                node = node.func
+            else:
+                break
+        parts.append(node.id if isinstance(node, ast.Name) else "")
+        return ".".join(reversed(parts))
+
+    def _parse_dict_literal(self, node):
+        """Parse ast.Dict to extract string keys and nested dict structures."""
+        if not isinstance(node, ast.Dict):
+            return None
+        result = {}
+        for key, val in zip(node.keys, node.values):
+            # Extract key name: string constant, or attribute name (e.g., Enum.VALUE)
+            key_name = None
+            if isinstance(key, ast.Constant) and isinstance(key.value, str):
+                key_name = key.value
+            elif isinstance(key, ast.Attribute):
+                key_name = key.attr
+            elif isinstance(key, ast.Name):
+                key_name = key.id
+
+            if key_name:
+                inner = self._parse_dict_literal(val) if isinstance(val, ast.Dict) else None
+                if inner is None and isinstance(val, ast.Call):
+                    inner = self._parse_dict_call(val)
+                    if inner is None:
+                        # Try parsing constructor calls (e.g., dataclass instances) by keyword args
+                        inner = self._parse_constructor_kwargs(val)
+                result[key_name] = inner if inner else True
+        return result if result else None
+
+    def _parse_constructor_kwargs(self, node):
+        """Parse a constructor/function call to extract string keyword arguments."""
+        if not isinstance(node, ast.Call) or not node.keywords:
+            return None
+        result = {}
+        for kw in node.keywords:
+            if kw.arg:
+                if isinstance(kw.value, ast.Constant) and isinstance(kw.value.value, str):
+                    result[kw.arg] = kw.value.value
+        return result if result else None
+
+    def _parse_dict_call(self, node):
+        """Parse dict() constructor call to extract string keys."""
+        if not isinstance(node, ast.Call):
+            return None
+        fname = self._get_func_name(node.func)
+        if fname != 'dict':
+            return None
+        result = {}
+        for kw in node.keywords:
+            if kw.arg:
+                inner = self._parse_dict_call(kw.value)
+                if inner is None and isinstance(kw.value, ast.Dict):
+                    inner = self._parse_dict_literal(kw.value)
+                result[kw.arg] = inner if inner else True
+        return result if result else None
 
-class ASTVisitor(ImportVisitor):
+# Files whose source contains none of parser.MARKERS only get LiteralVisitor. A new pattern
+# recognised here (decorator, router/app constructor, model base, registration call) needs a
+# marker there as well, or files that use only that pattern lose their routes.
+class ASTVisitor(LiteralParsingMixin, ImportVisitor):
     def __init__(self, file_data: FileData, adapters: List[BaseAdapter]):
         super().__init__(file_data)
         self.adapters = adapters
@@ -37,10 +178,42 @@ class ASTVisitor(ImportVisitor):
         self.include_child_calls: Set[str] = set()
         self._func_depth = 0  # Track function nesting to skip router creation inside functions
         self._router_factories = {}  # func_name -> (func_node, router_init_node, register_calls)
+        # id(route) -> ({(cat, module): dep entry}, {already recorded (cat, module, item)}), so
+        # repeated calls inside a handler don't rescan the dependency lists
+        self._dep_index = {}
+
+    def generic_visit(self, node):
+        # Subtrees without a visit_* handler (most expressions) are walked with an explicit stack
+        # instead of a call per node; nodes that have one are dispatched in the same pre-order
+        # ast.NodeVisitor would use, so handlers keep scoping their state around the children.
+        handlers = self._handlers
+        generic = ASTVisitor.generic_visit
+        stack = [node]
+        while stack:
+            n = stack.pop()
+            cls = n.__class__
+            if n is not node:
+                handler = handlers.get(cls)
+                if handler is None:
+                    handler = self._lookup_handler(cls)
+                if handler is not generic:
+                    handler(self, n)
+                    continue
+            fields = _CHILD_FIELDS.get(cls)
+            if fields is None:
+                fields = _CHILD_FIELDS[cls] = tuple(f for f in cls._fields if f != 'ctx')
+            # Pushed last-to-first so they pop in source order
+            for field in reversed(fields):
+                value = getattr(n, field, None)
+                if value.__class__ is list:
+                    for item in reversed(value):
+                        if isinstance(item, ast.AST): stack.append(item)
+                elif isinstance(value, ast.AST):
+                    stack.append(value)
 
     def visit_Assign(self, node):
         # 1. Constant tracking
-        if isinstance(node.value, (ast.Constant, ast.Str)):
+        if isinstance(node.value, ast.Constant):
             val = str(node.value.value)
             for t in node.targets:
                 if isinstance(t, ast.Name):
@@ -135,7 +308,7 @@ class ASTVisitor(ImportVisitor):
                         self.data.dict_literals[var_name] = parsed
 
             # Constant tracking
-            if isinstance(node.value, (ast.Constant, ast.Str)):
+            if isinstance(node.value, ast.Constant):
                 self.data.constants[var_name] = str(node.value.value)
 
             # Router/App definition (skip inside function bodies)
@@ -158,11 +331,9 @@ class ASTVisitor(ImportVisitor):
     def visit_ClassDef(self, node):
         # Basic model detection
         bases = [self._expression_to_str(b) for b in node.bases]
-        is_model = any(
-            any(k in b for k in ["BaseModel", "SQLModel", "Schema", "Model", "pydantic"])
-            for b in bases
-        )
-        if any(kw.arg == "table" for kw in node.keywords): is_model = True
+        # "Model" also covers BaseModel/SQLModel; substring match keeps custom bases like MyBaseModel
+        is_model = any("Model" in b or "Schema" in b or "pydantic" in b for b in bases)
+        if not is_model and any(kw.arg == "table" for kw in node.keywords): is_model = True
 
         if is_model:
             fields = []
@@ -191,12 +362,11 @@ class ASTVisitor(ImportVisitor):
                       route = RouteDef(path, method, router_var, node.lineno, self.data.file_path, function_name=node.name)
 
                       # Request Body (Generic)
-                      SPECIAL_TYPES = {'Request', 'Response', 'BackgroundTasks', 'Session', 'AsyncSession', 'HTTPConnection', 'WebSocket', 'HTTPException'}
                       for arg in node.args.args:
                         if arg.arg == 'self': continue
                         if not arg.annotation: continue
                         type_name = self._get_base_type_name(arg.annotation)
-                        if type_name and type_name not in SPECIAL_TYPES:
+                        if type_name and type_name not in _SPECIAL_TYPES:
                             route.request_model_name = type_name
                             break
 
@@ -263,10 +433,15 @@ class ASTVisitor(ImportVisitor):
         if self.current_route:
             self._analyze_dependency(node, fname)
 
+        # "router.include_router" -> caller "router", method "include_router"; sliced once for every check below
+        dotted = '.' in fname
+        if dotted:
+            caller = fname[:fname.find('.')]
+            meth = fname[fname.rfind('.') + 1:]
+
         # Include Router
         if "include_router" in fname:
-             if '.' in fname:
-                 caller = fname.split('.')[0]
+             if dotted:
                  if caller in self.data.routers:
                      included = self._get_func_name(node.args[0]) if node.args else None
                      prefix_node = self._extract_kwarg(node, "prefix", "")
@@ -278,24 +453,17 @@ class ASTVisitor(ImportVisitor):
         # Child Router
         for adapter in self.adapters:
             if adapter.is_include_child_router(node):
-                 if '.' in fname:
-                    caller = fname.split('.')[0]
+                 if dotted:
                     self.include_child_calls.add(caller)
                     if caller in self.data.routers:
                         self.data.routers[caller].includes_children = True
 
-        # Schema Registration
-        if '.' in fname:
-            rvar, meth = fname.split('.')[0], fname.split('.')[-1]
-            if rvar in self.data.routers:
-                rdef = self.data.routers[rvar]
-                if node.args:
-                     schema_name = self._get_base_type_name(node.args[0])
-                     if meth == 'register_list_schema': rdef.list_schema = schema_name
-                     elif meth == 'register_retrieve_schema': rdef.retrieve_schema = schema_name
-                     elif meth == 'register_create_schema': rdef.create_schema = schema_name
-                     elif meth == 'register_update_schema': rdef.update_schema = schema_name
-                     elif meth == 'register_delete_schema': rdef.delete_schema = schema_name
+        # Schema Registration (the method name is checked first, so other router calls such as
+        # router.get("/") don't pay for naming their first argument)
+        if dotted:
+            attr = _SCHEMA_REGISTRATIONS.get(meth)
+            if attr is not None and node.args and caller in self.data.routers:
+                setattr(self.data.routers[caller], attr, self._get_base_type_name(node.args[0]))
 
         self.generic_visit(node)
 
@@ -471,7 +639,8 @@ class ASTVisitor(ImportVisitor):
         router_var = None
         register_calls = {}
 
-        for node in ast.walk(func_node):
+        # Everything matched below is a statement, so expressions needn't be walked
+        for node in _walk_statements(func_node):
             # Find CrudAPIRouter() creation
             if isinstance(node, ast.Assign) and isinstance(node.value, ast.Call):
                 for t in node.targets:
@@ -736,58 +905,6 @@ class ASTVisitor(ImportVisitor):
                 result.append(tuple(values))
         return result if result else None
 
-    def _parse_dict_literal(self, node):
-        """Parse ast.Dict to extract string keys and nested dict structures."""
-        if not isinstance(node, ast.Dict):
-            return None
-        result = {}
-        for key, val in zip(node.keys, node.values):
-            # Extract key name: string constant, or attribute name (e.g., Enum.VALUE)
-            key_name = None
-            if isinstance(key, ast.Constant) and isinstance(key.value, str):
-                key_name = key.value
-            elif isinstance(key, ast.Attribute):
-                key_name = key.attr
-            elif isinstance(key, ast.Name):
-                key_name = key.id
-
-            if key_name:
-                inner = self._parse_dict_literal(val) if isinstance(val, ast.Dict) else None
-                if inner is None and isinstance(val, ast.Call):
-                    inner = self._parse_dict_call(val)
-                    if inner is None:
-                        # Try parsing constructor calls (e.g., dataclass instances) by keyword args
-                        inner = self._parse_constructor_kwargs(val)
-                result[key_name] = inner if inner else True
-        return result if result else None
-
-    def _parse_constructor_kwargs(self, node):
-        """Parse a constructor/function call to extract string keyword arguments."""
-        if not isinstance(node, ast.Call) or not node.keywords:
-            return None
-        result = {}
-        for kw in node.keywords:
-            if kw.arg:
-                if isinstance(kw.value, ast.Constant) and isinstance(kw.value.value, str):
-                    result[kw.arg] = kw.value.value
-        return result if result else None
-
-    def _parse_dict_call(self, node):
-        """Parse dict() constructor call to extract string keys."""
-        if not isinstance(node, ast.Call):
-            return None
-        fname = self._get_func_name(node.func)
-        if fname != 'dict':
-            return None
-        result = {}
-        for kw in node.keywords:
-            if kw.arg:
-                inner = self._parse_dict_call(kw.value)
-                if inner is None and isinstance(kw.value, ast.Dict):
-                    inner = self._parse_dict_literal(kw.value)
-                result[kw.arg] = inner if inner else True
-        return result if result else None
-
     # =========================================================================
     # F-string evaluation with variable substitution
     # =========================================================================
@@ -845,7 +962,7 @@ class ASTVisitor(ImportVisitor):
             if dep_name:
                 # Classify based on name, default to "services"
                 cat = "services"
-                if any(x in dep_name.lower() for x in ["db", "session", "repo", "database"]):
+                if _DB_DEP_NAME(dep_name.lower()):
                     cat = "database"
 
                 # Use module name as label if possible
@@ -854,77 +971,119 @@ class ASTVisitor(ImportVisitor):
                 self._add_dep(cat, mod, dep_name)
                 return
 
-        is_db = ("session" in fname or "db" in fname or "repo" in fname) and \
-                any(x in fname for x in ["exec", "add", "commit", "query", "get", "flush", "refresh"])
-        if fname in ["select", "update", "delete", "insert"]: is_db = True
+        is_db = fname in _SQL_FUNCS or (_DB_ROOT(fname) is not None and _DB_VERB(fname) is not None)
 
         if is_db:
              self._add_dep("database", "Database", fname)
              for arg in node.args:
                  v = self._get_base_type_name(arg)
                  if v and v[0].isupper() and ("Model" in v or "Schema" in v):
-                      if v not in self.current_route.dependencies["tables"]:
-                           self.current_route.dependencies["tables"].append(v)
+                      self._add_unique("tables", v)
 
-        if any(fname.startswith(x) for x in ["requests.", "httpx."]):
+        if fname.startswith(_HTTP_CLIENTS):
             self._add_dep("external", "External API", fname)
             if node.args:
                  url = self.adapters[0]._extract_str(node.args[0])
-                 if url and url not in self.current_route.dependencies["apiCalls"]:
-                      self.current_route.dependencies["apiCalls"].append(url)
+                 if url:
+                      self._add_unique("apiCalls", url)
 
         if '.' in fname:
             mod = fname.split('.')[0]
-            if mod.endswith("_service") or mod.endswith("Service"):
+            if mod.endswith(("_service", "Service")):
                 self._add_dep("services", mod, fname)
 
+    def _route_dep_index(self):
+        route = self.current_route
+        index = self._dep_index.get(id(route))
+        if index is None:
+            index = self._dep_index[id(route)] = ({}, set())
+        return index
+
     def _add_dep(self, cat, mod, item):
-        for d in self.current_route.dependencies[cat]:
-            if d["module"] == mod:
-                if item not in d["items"]: d["items"].append(item)
-                return
-        self.current_route.dependencies[cat].append({
-            "module": mod, "moduleLabel": mod, "type": cat, "items": [item], "count": 1
-        })
+        entries, seen = self._route_dep_index()
+        d = entries.get((cat, mod))
+        if d is None:
+            d = entries[(cat, mod)] = DepEntry(mod, cat)
+            self.current_route.deps()[cat].append(d)
+        if (cat, mod, item) not in seen:
+            seen.add((cat, mod, item))
+            d.items.append(item)
+
+    def _add_unique(self, cat, value):
+        """Append value to a flat dependency list (tables, apiCalls) unless already recorded."""
+        _, seen = self._route_dep_index()
+        if (cat, value) not in seen:
+            seen.add((cat, value))
+            self.current_route.deps()[cat].append(value)
 
     # =========================================================================
     # AST utility methods (unchanged)
     # =========================================================================
 
-    def _get_func_name(self, node):
-        if isinstance(node, ast.Name): return node.id
-        if isinstance(node, ast.Attribute): return f"{self._get_func_name(node.value)}.{node.attr}"
-        if isinstance(node, ast.Call): return self._get_func_name(node.func)
-        return ""
-
     def _expression_to_str(self, node):
-        if isinstance(node, ast.Name): return node.id
-        if isinstance(node, ast.Attribute): return f"{self._expression_to_str(node.value)}.{node.attr}"
-        if isinstance(node, ast.Subscript):
-            v = self._expression_to_str(node.value)
+        buf = []
+        self._expression_parts(node, buf)
+        return "".join(buf)
+
+    def _expression_parts(self, node, buf):
+        # Pieces go into one shared buffer, so nested generics are joined once rather than per level.
+        # Attribute chains are walked iteratively; only subscripts recurse (bounded by generic nesting)
+        attrs = []
+        while isinstance(node, ast.Attribute):
+            attrs.append(node.attr)
+            node = node.value
+        if isinstance(node, ast.Name):
+            buf.append(node.id)
+        elif isinstance(node, ast.Subscript):
+            self._expression_parts(node.value, buf)
+            buf.append("[")
             sl = node.slice
-            if hasattr(ast, 'Index') and isinstance(sl, ast.Index): sl = sl.value
-            inner = ""
+            if isinstance(sl, _INDEX): sl = sl.value
             if isinstance(sl, ast.Tuple):
-                 inner = ", ".join(self._expression_to_str(e) for e in sl.elts)
+                 for i, e in enumerate(sl.elts):
+                     if i: buf.append(", ")
+                     self._expression_parts(e, buf)
             else:
-                 inner = self._expression_to_str(sl)
-            return f"{v}[{inner}]"
-        return self._get_func_name(node)
+                 self._expression_parts(sl, buf)
+            buf.append("]")
+        else:
+            buf.append(self._get_func_name(node))
+        for attr in reversed(attrs):
+            buf.append(".")
+            buf.append(attr)
 
     def _get_base_type_name(self, node):
-        if isinstance(node, ast.Name): return node.id
-        if isinstance(node, ast.Attribute): return f"{self._get_base_type_name(node.value)}.{node.attr}"
-        if isinstance(node, ast.Call): return self._get_base_type_name(node.func)
-        if isinstance(node, ast.Subscript):
-             val = self._get_base_type_name(node.value)
-             if val in ['Annotated', 'List', 'Optional', 'Union', 'ApiResponse', 'Type', 'Generic']:
-                  sl = node.slice
-                  if hasattr(ast, 'Index') and isinstance(sl, ast.Index): sl = sl.value
-                  first = sl.elts[0] if isinstance(sl, ast.Tuple) and sl.elts else sl
-                  return self._get_base_type_name(first)
-             return val
-        return ""
+        # Wrapper generics (Optional[List[User]]) are unwrapped in a loop rather than a call per level;
+        # attributes met along the way are kept per level and appended once the inner name is known
+        levels = []
+        while True:
+            attrs = []
+            while True:
+                if isinstance(node, ast.Attribute):
+                    attrs.append(node.attr)
+                    node = node.value
+                elif isinstance(node, ast.Call):
+                    node = node.func
+                else:
+                    break
+            levels.append(attrs)
+            if isinstance(node, ast.Name):
+                head = node.id
+            elif isinstance(node, ast.Subscript):
+                 head = self._get_base_type_name(node.value)
+                 if head in _TYPE_WRAPPERS:
+                      sl = node.slice
+                      if isinstance(sl, _INDEX): sl = sl.value
+                      node = sl.elts[0] if isinstance(sl, ast.Tuple) and sl.elts else sl
+                      continue
+            else:
+                head = ""
+            break
+        if len(levels) == 1 and not attrs: return head
+        parts = [head]
+        for attrs in reversed(levels):
+            parts.extend(reversed(attrs))
+        return ".".join(parts)
 
     def _process_function_deps(self, func_node):
         """
@@ -943,9 +1102,9 @@ class ASTVisitor(ImportVisitor):
 
         base = self._get_base_type_name(node.value)
 
-        if base in ['Optional', 'List', 'Union', 'Iterable', 'Sequence']:
+        if base in _DEPENDENCY_CONTAINERS:
             sl = node.slice
-            if hasattr(ast, 'Index') and isinstance(sl, ast.Index): sl = sl.value
+            if isinstance(sl, _INDEX): sl = sl.value
 
             if isinstance(sl, ast.Tuple):
                 for elt in sl.elts:
@@ -958,7 +1117,7 @@ class ASTVisitor(ImportVisitor):
             sl = node.slice
 
             items = []
-            if hasattr(ast, 'Index') and isinstance(sl, ast.Index): sl = sl.value
+            if isinstance(sl, _INDEX): sl = sl.value
 
             if isinstance(sl, ast.Tuple):
                 items = sl.elts
@@ -980,3 +1139,30 @@ class ASTVisitor(ImportVisitor):
         for k in node.keywords:
             if k.arg == name: return k.value
         return default
+
+
+class LiteralVisitor(LiteralParsingMixin, ImportVisitor):
+    """
+    Imports plus dict literals only, for files with none of the route/router/model markers.
+    Those are the only parts of such a file that other files read back (re-exported names and
+    config dicts driving factory loops), so the full ASTVisitor pass would add nothing used.
+    """
+    def visit_Assign(self, node):
+        self._store_dict([t.id for t in node.targets if isinstance(t, ast.Name)], node.value)
+
+    def visit_AnnAssign(self, node):
+        if node.value and isinstance(node.target, ast.Name):
+            self._store_dict([node.target.id], node.value)
+
+    def _store_dict(self, names, value):
+        # Mirrors the dict literal / dict() storage in ASTVisitor.visit_Assign
+        if isinstance(value, ast.Dict):
+            parse = self._parse_dict_literal
+        elif isinstance(value, ast.Call) and self._get_func_name(value.func) == 'dict':
+            parse = self._parse_dict_call
+        else:
+            return
+        for name in names:
+            parsed = parse(value)
+            if parsed:
+                self.data.dict_literals[name] = parsed
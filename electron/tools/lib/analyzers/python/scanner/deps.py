@@ -1,27 +1,29 @@
-from typing import Dict, List, Any
+import os
+from typing import Dict, List, Any, Set, Tuple
 from .core.models import FileData
 from .core.resolver import ImportResolver
 
 def generate_dependency_graph(file_map: Dict[str, FileData], resolver: ImportResolver, errors: List[Dict[str, str]] = None) -> Dict[str, Any]:
-    nodes = []
-    edges = []
-    added_nodes = set()
+    nodes: Dict[str, Dict[str, Any]] = {} # id -> node, insertion-ordered
     node_id_map = {} # path -> id
 
     # Helper to add node
     def add_node(path_str: str, is_external: bool = False):
-        if path_str in added_nodes: return
-        added_nodes.add(path_str)
+        if path_str in nodes: return
         
         label = path_str.split('/')[-1] if '/' in path_str else path_str
         
-        nodes.append({
+        nodes[path_str] = {
             "id": path_str,
             "label": label,
             "type": "external" if is_external else "file",
             "isExternal": is_external
-        })
+        }
     
+    # Absolute ids are the root plus the relative path; concatenating avoids a Path object per file
+    root_str = os.path.join(str(resolver.root), '')
+    native_sep = os.sep == '/'
+
     # Add all scanned files as nodes first
     for rel_path, fd in file_map.items():
         # Ideally we want absolute paths for ID to match frontend expectations?
@@ -38,56 +40,33 @@ def generate_dependency_graph(file_map: Dict[str, FileData], resolver: ImportRes
         # `analyzeDependencies` in `core.ts` works with absolute paths.
         # We should convert to absolute paths here.
         
-        abs_path = str(resolver.root / rel_path)
+        abs_path = root_str + (rel_path if native_sep else rel_path.replace('/', os.sep))
         add_node(abs_path, is_external=False)
         node_id_map[rel_path] = abs_path
 
     # Build edges
-    for rel_path, fd in file_map.items():
-        source_node = node_id_map.get(rel_path)
-        if not source_node: continue
+    # Resolve each distinct import string once: abs id of the target file, or None for
+    # external dependencies (e.g. "sqlalchemy"), which are not shown
+    unique_imports = {imp_str for fd in file_map.values() for imp_str in fd.imports.values()}
+    targets = {}
+    for imp_str in unique_imports:
+        target_file, _ = resolver.resolve_module(imp_str, None)
+        # Target is a relative path in our file_map keys (e.g "app/models/user.py"), so its node exists
+        targets[imp_str] = node_id_map[target_file] if target_file else None
+
+    edges = [
+        {"source": node_id_map[rel_path], "target": target}
+        for rel_path, fd in file_map.items()
+        for target in map(targets.__getitem__, fd.imports.values())
+        if target
+    ]
 
-        for alias, imp_str in fd.imports.items():
-            # Resolve import
-            # We use the rel_path as "current_file" context for resolver if resolver expects it?
-            # resolver.resolve_module(module_str, current_file)
-            # resolver implementation:
-            # resolve_module(module_str, current_file) -> tries to split module_str
-            # It expects `current_file` to be a path useful for relative resolution? 
-            # Actually `ImportResolver` in `resolver.py` (read earlier) doesn't seem to use `current_file` for relative logic in the snippet I saw?
-            # Wait, I read `resolver.py` step 1263.
-            # It DOES NOT implement relative import logic (dots). It only splits `module_str`.
-            # That's a limitation of the current resolver!
-            # BUT `FileData` from `ASTVisitor` has imports. `ASTVisitor` logic wasn't fully inspected for how it stores imports.
-            # If `ASTVisitor` resolves '.' to absolute string before storing, good.
-            # If not, we might be missing relative imports in `fd.imports`.
-            
-            # Let's assume `fd.imports` contains raw strings like "app.models".
-            
-            target_file, _ = resolver.resolve_module(imp_str, rel_path)
-            
-            if target_file:
-                # Target is a relative path in our file_map keys (e.g "app/models/user.py")
-                target_abs = str(resolver.root / target_file)
-                add_node(target_abs, is_external=False)
-                
-                edges.append({
-                    "source": source_node,
-                    "target": target_abs
-                })
-            else:
-                # External dependency? (e.g. "sqlalchemy")
-                # If we want to show it:
-                # add_node(imp_str, is_external=True)
-                # edges.append({ "source": source_node, "target": imp_str })
-                pass
-                
     # Auto-Aggregation: If too many nodes, group by folder
     if len(nodes) > 30:
-        result = aggregate_by_folder(nodes, edges)
+        result = aggregate_by_folder(list(nodes.values()), edges)
     else:
         result = {
-            "nodes": nodes,
+            "nodes": list(nodes.values()),
             "edges": edges
         }
     
@@ -96,7 +75,7 @@ def generate_dependency_graph(file_map: Dict[str, FileData], resolver: ImportRes
 
 def aggregate_by_folder(nodes: List[Dict], edges: List[Dict]) -> Dict[str, Any]:
     folder_nodes = {}
-    folder_edges = set()
+    folder_edges: Set[Tuple[str, str]] = set()
     
     # Map file ID to folder ID
     file_to_folder = {}
@@ -112,7 +91,7 @@ def aggregate_by_folder(nodes: List[Dict], edges: List[Dict]) -> Dict[str, Any]:
         else:
             # It's a file path
             # /Users/.../app/api/router.py -> /Users/.../app/api
-            parent_dir = "/".join(n["id"].split('/')[:-1])
+            parent_dir = n["id"].rpartition('/')[0]
             file_to_folder[n["id"]] = parent_dir
             
             if parent_dir not in folder_nodes:
@@ -128,18 +107,10 @@ def aggregate_by_folder(nodes: List[Dict], edges: List[Dict]) -> Dict[str, Any]:
         target_folder = file_to_folder.get(e["target"])
         
         if source_folder and target_folder and source_folder != target_folder:
-            # Avoid duplicate edges
-            edge_id = f"{source_folder}->{target_folder}"
-            if edge_id not in folder_edges:
-                folder_edges.add(edge_id)
+            # Avoid duplicate edges (tuples, so ids containing "->" can't collide)
+            folder_edges.add((source_folder, target_folder))
 
-    final_edges = []
-    for edge_str in folder_edges:
-        src, dst = edge_str.split("->")
-        final_edges.append({
-            "source": src,
-            "target": dst
-        })
+    final_edges = [{"source": src, "target": dst} for src, dst in folder_edges]
         
     return {
         "nodes": list(folder_nodes.values()),
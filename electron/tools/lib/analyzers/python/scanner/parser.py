@@ -0,0 +1,181 @@
+import ast
+import hashlib
+import os
+import pickle
+import time
+import warnings
+from typing import Optional, Set, Tuple
+
+from .core.models import FileData
+from .core.visitor import ASTVisitor, ImportVisitor, LiteralVisitor
+from .adapters.fastapi import FastAPIAdapter
+from .adapters.custom import CustomAdapter
+
+# Suppress SyntaxWarnings from ast.parse() on Python 3.12+ (invalid escape sequences in scanned code).
+# Set here rather than in __main__ so spawned worker processes inherit it too.
+warnings.filterwarnings("ignore", category=SyntaxWarning)
+
+# Bump whenever FileData or the visitors change shape, so stale cache entries are ignored
+CACHE_VERSION = 5
+
+def _code_fingerprint() -> str:
+    """mtime/size of the scanner's own sources, so editing them also invalidates cached entries."""
+    h = hashlib.blake2b(digest_size=8)
+    pkg = os.path.dirname(os.path.abspath(__file__))
+    try:
+        for sub in ('', 'core', 'adapters'):
+            directory = os.path.join(pkg, sub)
+            for name in sorted(os.listdir(directory)):
+                if name.endswith('.py'):
+                    st = os.stat(os.path.join(directory, name))
+                    h.update(f"{sub}/{name}:{st.st_mtime_ns}:{st.st_size};".encode('utf-8'))
+    except OSError:
+        # Not laid out as plain files (e.g. bundled); fall back to CACHE_VERSION alone
+        return ""
+    return h.hexdigest()
+
+CODE_FINGERPRINT = _code_fingerprint()
+
+# (full_path, rel_path, deps_only, cache_dir, prefilter)
+Task = Tuple[str, str, bool, Optional[str], bool]
+
+# Every file the full ASTVisitor can get a route, router, app, model, include or schema
+# registration out of contains one of these (decorators, *Router/FastAPI calls, model bases,
+# table=, include_*/register_* calls). Files without any only need LiteralVisitor.
+# Extend this whenever ASTVisitor learns to recognise a new pattern.
+MARKERS = (b"@", b"Router", b"FastAPI", b"Model", b"Schema", b"pydantic", b"table", b"include_", b"register_")
+
+# One adapter set per process, re-pointed at each file's constants. Files are only ever
+# visited one at a time per process (I/O threads just read), so sharing them is safe.
+ADAPTERS = [CustomAdapter({}), FastAPIAdapter({})]
+
+# Entries not used for this long are deleted, so projects that were moved or removed don't keep
+# theirs forever. A hit refreshes an entry's mtime at most once per CACHE_PRUNE_INTERVAL.
+CACHE_MAX_AGE = 30 * 24 * 3600
+# The whole cache directory is swept at most this often, tracked by the mtime of PRUNE_STAMP
+CACHE_PRUNE_INTERVAL = 24 * 3600
+PRUNE_STAMP = '.last-prune'
+
+def default_cache_dir() -> str:
+    base = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base, 'duke', 'scanner')
+
+def _cache_path(cache_dir: str, full_path: str, deps_only: bool) -> str:
+    # One entry per (file, mode): a changed file overwrites its old entry instead of adding a new one
+    key = hashlib.blake2b(f"{full_path}:{int(deps_only)}".encode('utf-8'), digest_size=16).hexdigest()
+    return os.path.join(cache_dir, f"{key}.pkl")
+
+def _load_cached(path: str, stamp: tuple):
+    try:
+        with open(path, 'rb') as f:
+            cached_stamp, fd, calls = pickle.load(f)
+            used = os.fstat(f.fileno()).st_mtime
+    except Exception:
+        return None
+    if cached_stamp != stamp:
+        return None
+    if time.time() - used > CACHE_PRUNE_INTERVAL:
+        # Entries are only rewritten when their file changes; mark this one as still in use
+        try: os.utime(path)
+        except OSError: pass
+    return fd, calls
+
+def _store_cached(path: str, stamp: tuple, fd: FileData, calls: Set[str]):
+    tmp = f"{path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(tmp, 'wb') as f:
+            pickle.dump((stamp, fd, calls), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, path)
+    except Exception:
+        # Caching is best effort; a read-only or full disk (or an unpicklable value) must not fail the scan
+        try: os.remove(tmp)
+        except OSError: pass
+
+def prune_cache(cache_dir: str, max_age: float = CACHE_MAX_AGE):
+    """Delete entries (and stray temp files) unused for max_age seconds, at most once per CACHE_PRUNE_INTERVAL."""
+    now = time.time()
+    stamp_path = os.path.join(cache_dir, PRUNE_STAMP)
+    try:
+        if now - os.stat(stamp_path).st_mtime < CACHE_PRUNE_INTERVAL:
+            return
+    except OSError:
+        pass
+    try:
+        with open(stamp_path, 'ab'):
+            pass
+        os.utime(stamp_path)
+        with os.scandir(cache_dir) as it:
+            for entry in it:
+                if entry.name.endswith(('.pkl', '.tmp')):
+                    try:
+                        if now - entry.stat().st_mtime > max_age:
+                            os.remove(entry.path)
+                    except OSError:
+                        pass
+    except OSError:
+        # Missing or read-only cache directory: nothing to prune
+        pass
+
+def read_file(task: Task):
+    """
+    I/O half of parse_file: returns (result, source, stamp). result is already final on a
+    cache hit or read error; otherwise source holds the raw file bytes for parse_source.
+    """
+    full_path, rel_path, deps_only, cache_dir, prefilter = task
+    stamp = None
+    try:
+        if cache_dir:
+            st = os.stat(full_path)
+            stamp = (CACHE_VERSION, CODE_FINGERPRINT, rel_path, st.st_mtime_ns, st.st_size, prefilter)
+            hit = _load_cached(_cache_path(cache_dir, full_path, deps_only), stamp)
+            if hit is not None:
+                return (rel_path, hit[0], hit[1], None), None, stamp
+
+        # Bytes go straight to the parser: no decode/re-encode round trip, and the
+        # source encoding (BOM, coding cookie) is honoured the way the interpreter would
+        with open(full_path, 'rb') as fobj:
+            return None, fobj.read(), stamp
+    except Exception as e:
+        return (rel_path, None, set(), str(e)), None, stamp
+
+def parse_source(task: Task, source: bytes, stamp: Optional[tuple]) -> Tuple[str, Optional[FileData], Set[str], Optional[str]]:
+    """CPU half of parse_file: parse and visit source, storing the result in the cache when enabled."""
+    full_path, rel_path, deps_only, cache_dir, prefilter = task
+    try:
+        tree = ast.parse(source, filename=full_path)
+        fd = FileData(rel_path)
+
+        if deps_only:
+            # Lightweight scan
+            visitor = ImportVisitor(fd)
+            visitor.visit(tree)
+            calls = set()
+        elif prefilter and not any(marker in source for marker in MARKERS):
+            # Nothing API-related in here: keep what other files can import from it
+            LiteralVisitor(fd).visit(tree)
+            calls = set()
+        else:
+            # Full scan
+            for adapter in ADAPTERS:
+                adapter.set_constants(fd.constants)
+            visitor = ASTVisitor(fd, ADAPTERS)
+            visitor.visit(tree)
+            calls = visitor.include_child_calls
+
+        if cache_dir:
+            _store_cached(_cache_path(cache_dir, full_path, deps_only), stamp, fd, calls)
+        return rel_path, fd, calls, None
+    except Exception as e:
+        return rel_path, None, set(), str(e)
+
+def parse_file(task: Task) -> Tuple[str, Optional[FileData], Set[str], Optional[str]]:
+    """
+    Parse and visit a single file, returning (rel_path, file_data, include_child_calls, error).
+    Lives outside __main__ so worker processes can import it under the spawn start method.
+    When the task carries a cache_dir, results are reused while the file's mtime and size are unchanged.
+    """
+    result, source, stamp = read_file(task)
+    if result is not None:
+        return result
+    return parse_source(task, source, stamp)